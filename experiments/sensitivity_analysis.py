@@ -36,8 +36,7 @@ def run_k_sensitivity():
     print("--- Experiment: Sensitivity Analysis (Parameter k) ---")
 
     for k in k_values:
-        params = SystemParameters()
-        params.k = k  # Override fragility parameter
+        params = SystemParameters(k=k)  # Override fragility parameter
 
         peak_Ps = []
         for T in T_range:
@@ -0,0 +1,47 @@
+import argparse
+import os
+import sys
+
+# Ensure the repository root is on sys.path (works when running from any CWD)
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import numpy as np
+from sidsmp.core.parameters import SystemParameters
+from sidsmp.simulation.surrogate import SurrogateTable
+
+
+def build_default_table(path="surrogate_table.npz", T_range=(0.0, 5.0), T_points=101,
+                        k_range=(0.8, 1.6), k_points=17):
+    """
+    Precompute the default surrogate table over (T_load, k) and save it to `path`.
+
+    The domain covers the load range used by the validation suite and a band of
+    fragility values around the default k, so that the usual dashboard queries
+    (peak P, final coupling, final I_sub, time to decoupling) are answered from
+    the table instead of by integration.
+
+    Returns
+    -------
+    SurrogateTable
+        The table that was written to disk.
+    """
+    print(f"--- Building surrogate table (T_load: {T_points} points, k: {k_points} points) ---")
+    table = SurrogateTable.build(
+        np.linspace(*T_range, T_points),
+        {'k': np.linspace(*k_range, k_points)},
+        params=SystemParameters(),
+    )
+    table.save(path)
+    print(f"Saved surrogate table to: {os.path.abspath(path)}")
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute a SIDSMP surrogate lookup table.")
+    parser.add_argument("path", nargs="?", default="surrogate_table.npz", help="output .npz file")
+    parser.add_argument("--T-points", type=int, default=101, help="grid points along T_load")
+    parser.add_argument("--k-points", type=int, default=17, help="grid points along k")
+    args = parser.parse_args()
+    build_default_table(args.path, T_points=args.T_points, k_points=args.k_points)
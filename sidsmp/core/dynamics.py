@@ -2,7 +2,15 @@
 import numpy as np
 
 
-def system_derivatives(y, t, T_load, params):
+def coupling_target(T_load, params):
+    """Coupling level the system relaxes towards at load T_load.
+
+    If T_load exceeds the decoupling threshold, the system tends to detach (target=0).
+    """
+    return 0.0 if T_load > params.decouple_threshold else 1.0
+
+
+def system_derivatives(y, t, T_load, params, lam=None):
     """Compute the ODE right-hand side for the SIDSMP toy model (v2.1).
 
     Includes:
@@ -14,22 +22,33 @@ def system_derivatives(y, t, T_load, params):
         y[1] = I_sub      (structured information)
         y[2] = coupling   (degree of connection to input / environment)
 
+    The state may also be an array of shape (3, ...), e.g. a dense
+    (I_raw, I_sub, coupling) mesh or a batch of trajectories; the equations
+    are then evaluated element-wise.
+
     Args:
-        y: current state [I_raw, I_sub, coupling]
+        y: current state [I_raw, I_sub, coupling], or an array of shape (3, ...)
         t: time (kept for ODE solver signature compatibility)
-        T_load: exogenous load / pressure parameter
+        T_load: exogenous load / pressure parameter (scalar)
         params: Parameters object (must expose lambda_func, alpha, C_base, beta, mu, zeta, decouple_threshold)
+        lam: transformability lambda(T_load), if already computed by the caller
+            (the engine passes it so odeint does not re-evaluate it at every step)
 
     Returns:
-        [dI_raw_dt, dI_sub_dt, d_coupling_dt]
+        [dI_raw_dt, dI_sub_dt, d_coupling_dt] for a single state (a plain list, as
+        odeint calls this at every step), or an array of shape (3, ...) for a batch
     """
+    single_state = np.ndim(y) == 1
     I_raw, I_sub, coupling = y
 
     # Numerical safety: keep coupling within [0, 1] for downstream computations
-    coupling = float(np.clip(coupling, 0.0, 1.0))
+    coupling = np.clip(coupling, 0.0, 1.0)
+    if single_state:
+        coupling = float(coupling)
 
     # 1) Base transformability (depends on load T_load)
-    lam = params.lambda_func(T_load)
+    if lam is None:
+        lam = params.lambda_func(T_load)
 
     # 2) I_raw dynamics (decay / overwrite of raw information)
     dI_raw_dt = -lam * I_raw
@@ -40,9 +59,7 @@ def system_derivatives(y, t, T_load, params):
     C_dynamic = params.C_base / (1 + params.beta * instability)
 
     # 4) Coupling dynamics (load-driven detachment mechanism)
-    # If T_load exceeds a threshold, the system tends to detach (target=0).
-    target_coupling = 0.0 if T_load > params.decouple_threshold else 1.0
-    d_coupling_dt = params.zeta * (target_coupling - coupling)
+    d_coupling_dt = params.zeta * (coupling_target(T_load, params) - coupling)
 
     # 5) I_sub dynamics (structure formation)
     # Input enters only if there is coupling (coupling * ...).
@@ -52,7 +69,45 @@ def system_derivatives(y, t, T_load, params):
 
     dI_sub_dt = input_flow - decay_flow
 
-    return [dI_raw_dt, dI_sub_dt, d_coupling_dt]
+    if single_state:
+        return [dI_raw_dt, dI_sub_dt, d_coupling_dt]
+    return np.stack(np.broadcast_arrays(dI_raw_dt, dI_sub_dt, d_coupling_dt))
+
+
+def compute_nullclines(I_raw, T_load, params, coupling=1.0):
+    """Nullclines of the system, projected on the (I_raw, I_sub) plane.
+
+    - dI_raw/dt = 0  on  I_raw = 0 (for lambda > 0)
+    - dI_sub/dt = 0  on  I_sub = input_flow(I_raw, coupling) / mu
+    - d(coupling)/dt = 0  on  coupling = ``coupling_target(T_load, params)``
+
+    The input flow is read off ``system_derivatives`` at I_sub = 0, so the
+    nullcline always follows the model equations.
+
+    Args:
+        I_raw: array of I_raw values at which the I_sub nullcline is evaluated
+        T_load: exogenous load / pressure parameter
+        params: Parameters object
+        coupling: coupling level of the (I_raw, I_sub) slice
+
+    Returns:
+        dict with keys 'I_raw', 'I_sub' (I_sub nullcline, NaN if mu = 0),
+        'I_raw_nullcline' and 'coupling_nullcline'
+    """
+    I_raw = np.asarray(I_raw, dtype=float)
+    state = np.stack(np.broadcast_arrays(I_raw, 0.0, float(coupling)))
+    input_flow = system_derivatives(state, 0.0, T_load, params)[1]
+    if params.mu > 0:
+        I_sub = input_flow / params.mu
+    else:
+        I_sub = np.full_like(I_raw, np.nan)
+
+    return {
+        'I_raw': I_raw,
+        'I_sub': I_sub,
+        'I_raw_nullcline': 0.0,
+        'coupling_nullcline': coupling_target(T_load, params),
+    }
 # sidsmp/core/metrics.py
 import numpy as np
 
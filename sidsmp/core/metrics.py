@@ -2,7 +2,7 @@
 import numpy as np
 
 
-def compute_energetics(I_raw, I_sub, coupling, C_dynamic, T_load, params):
+def compute_energetics(I_raw, I_sub, coupling, C_dynamic, T_load, params, lam=None):
     """
     THERMODYNAMIC METRICS (Eq. 7, Paper v2)
     P(t) = Useful Work / Dissipated Energy
@@ -10,6 +10,7 @@ def compute_energetics(I_raw, I_sub, coupling, C_dynamic, T_load, params):
     Notes:
     - This is a toy implementation meant for regime illustration and reproducible figures.
     - Inputs are sanitized to avoid negative-energy artifacts from numerical solvers.
+    - `lam` may be passed when lambda(T_load) is already known (e.g. once per run).
     """
     # --- Numerical safety guards (avoid negative energy artifacts) ---
     I_raw = max(float(I_raw), 0.0)
@@ -17,7 +18,8 @@ def compute_energetics(I_raw, I_sub, coupling, C_dynamic, T_load, params):
     coupling = float(coupling)
     C_dynamic = float(C_dynamic)
 
-    lam = params.lambda_func(T_load)
+    if lam is None:
+        lam = params.lambda_func(T_load)
 
     # --- 1. Structural Work (W_struct) ---
     # Energy successfully converted into structure.
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 import numpy as np
 
+# slots=True is only available from Python 3.10 onwards
+_DATACLASS_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemParameters:
     """System parameters for the SIDSMP toy model.
 
@@ -25,6 +29,10 @@ class SystemParameters:
     - ``zeta``: decoupling speed (inertia of detachment)
     - ``epsilon``: small numerical stabilizer to avoid division by zero
 
+    Instances are immutable and hashable, so they can be shared across worker
+    processes and used as cache keys. Use ``dataclasses.replace`` to derive a
+    modified copy, e.g. ``replace(params, k=2.0)``.
+
     Note
     ----
     These parameters are aligned with the SIDSMP v2.x paper narrative and the
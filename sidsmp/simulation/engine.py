@@ -3,49 +3,91 @@ import numpy as np
 from scipy.integrate import odeint
 from sidsmp.core.dynamics import system_derivatives
 from sidsmp.core.metrics import compute_energetics
+from sidsmp.simulation.results import SimulationResult
 
 
-def run_single_simulation(T_load, params, t_max=50, steps=500):
+def run_single_simulation(T_load, params, t_max=50, steps=500, dtype=np.float64):
+    """Integrate the model at a single load level.
+
+    Returns a ``SimulationResult``: a read-only mapping with the historical
+    keys ('t', 'I_raw', ..., 'P_t', 'lambda_val') whose series are views into
+    one contiguous buffer. Pass ``dtype=np.float32`` to halve its footprint;
+    the integration itself always runs in float64.
+    """
     t = np.linspace(0, t_max, steps)
 
     # Initial conditions: [I_raw=1.0, I_sub=0.0, Coupling=1.0]
     # Start fully coupled to the environment.
     y0 = [1.0, 0.0, 1.0]
 
+    # Transformability depends only on the load: compute it once per run
+    lam = params.lambda_func(T_load)
+
     # ODE integration
-    solution = odeint(system_derivatives, y0, t, args=(T_load, params))
+    solution = odeint(system_derivatives, y0, t, args=(T_load, params, lam))
 
+    res = SimulationResult.empty(steps, dtype=dtype, lambda_val=lam)
+    res['t'][:] = t
+    res['I_raw'][:] = solution[:, 0]
+    res['I_sub'][:] = solution[:, 1]
+    res['coupling'][:] = solution[:, 2]
+
+    # --- Post-processing metrics ---
+    # Recompute derived variables step-by-step (time-local), from the
+    # float64 solution so that float32 storage does not feed back into them
     I_raw = solution[:, 0]
     I_sub = solution[:, 1]
     coupling = solution[:, 2]
-
-    # --- Post-processing metrics ---
-    # Recompute derived variables step-by-step (time-local)
-    lam = params.lambda_func(T_load)
     dI_raw_dt = -lam * I_raw  # Analytical derivative of I_raw
 
-    W_arr, E_arr, P_arr, C_arr = [], [], [], []
+    C_arr, W_arr, E_arr, P_arr = res['C_dynamic'], res['W_struct'], res['E_diss'], res['P_t']
 
     for i in range(len(t)):
         # Recompute dynamic coherence C(t) at time index i
         instab = (dI_raw_dt[i]) ** 2
         C_dyn = params.C_base / (1 + params.beta * instab)
-        C_arr.append(C_dyn)
+        C_arr[i] = C_dyn
 
         # Energetics
-        W, E, P = compute_energetics(I_raw[i], I_sub[i], coupling[i], C_dyn, T_load, params)
-        W_arr.append(W)
-        E_arr.append(E)
-        P_arr.append(P)
+        W_arr[i], E_arr[i], P_arr[i] = compute_energetics(
+            I_raw[i], I_sub[i], coupling[i], C_dyn, T_load, params, lam
+        )
+
+    return res.freeze()
+
+
+def run_ensemble_simulation(T_load, params, y0, t_max=50, steps=500):
+    """Integrate a whole batch of initial conditions as a single ODE system.
+
+    The batch is stacked into one state vector of length 3 * n_traj. Each
+    trajectory only couples to itself, so the Jacobian is banded (bandwidth 2)
+    and odeint never forms a dense (3n x 3n) matrix.
+
+    Args:
+        T_load: exogenous load / pressure parameter
+        params: Parameters object
+        y0: initial conditions, shape (n_traj, 3) as [I_raw, I_sub, coupling]
+        t_max, steps: time grid, as in ``run_single_simulation``
+
+    Returns:
+        dict with 't' (steps,) and 'I_raw', 'I_sub', 'coupling' of shape (n_traj, steps)
+    """
+    t = np.linspace(0, t_max, steps)
+    y0 = np.atleast_2d(np.asarray(y0, dtype=float))
+    if y0.shape[1] != 3:
+        raise ValueError("y0 must have shape (n_traj, 3)")
+    n_traj = y0.shape[0]
+    lam = params.lambda_func(T_load)
+
+    def rhs(y, _t):
+        return system_derivatives(y.reshape(n_traj, 3).T, _t, T_load, params, lam).T.ravel()
+
+    solution = odeint(rhs, y0.ravel(), t, ml=2, mu=2)
+    solution = solution.reshape(steps, n_traj, 3)
 
     return {
         't': t,
-        'I_raw': I_raw,
-        'I_sub': I_sub,
-        'coupling': coupling,
-        'C_dynamic': np.array(C_arr),
-        'W_struct': np.array(W_arr),
-        'E_diss': np.array(E_arr),
-        'P_t': np.array(P_arr),
-        'lambda_val': lam
-    }
\ No newline at end of file
+        'I_raw': solution[:, :, 0].T,
+        'I_sub': solution[:, :, 1].T,
+        'coupling': solution[:, :, 2].T,
+    }
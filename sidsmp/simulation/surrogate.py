@@ -0,0 +1,290 @@
+# sidsmp/simulation/surrogate.py
+"""Precomputed lookup tables for the scalar summaries of a simulation run.
+
+Most downstream queries only need a handful of scalars (peak P(t), final
+coupling, final I_sub, time to decoupling) as a function of T_load and one or
+two SystemParameters fields. A ``SurrogateTable`` samples these scalars on a
+dense regular grid once, stores them in a compressed ``.npz`` file, and answers
+queries by multilinear interpolation. Each answer carries an error estimate;
+queries outside the tabulated domain, or whose estimate exceeds the requested
+tolerance, fall back to a real simulation.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, fields, replace
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from sidsmp.core.parameters import SystemParameters
+from sidsmp.simulation.engine import run_single_simulation
+
+# Scalars stored in every table (order matters for the on-disk layout)
+QUANTITIES = ("peak_P", "final_coupling", "final_I_sub", "time_to_decoupling")
+
+# Default absolute tolerance per quantity (time_to_decoupling is in time units)
+DEFAULT_MAX_ERROR = {
+    "peak_P": 1e-3,
+    "final_coupling": 1e-3,
+    "final_I_sub": 1e-3,
+    "time_to_decoupling": 0.05,
+}
+
+# Multiplier on the curvature term of the interpolation error estimate
+ESTIMATE_SAFETY = 2.0
+
+# Relative floor for the error estimate: odeint's default tolerances (~1.5e-8)
+# amplified by post-processing such as the threshold-crossing interpolation
+SOLVER_TOLERANCE = 1e-7
+
+_PARAM_FIELDS = tuple(f.name for f in fields(SystemParameters))
+
+
+def summarize_simulation(res, coupling_threshold=0.5):
+    """Reduce a ``run_single_simulation`` output to the tabulated scalars.
+
+    ``time_to_decoupling`` is the first time at which coupling drops below
+    ``coupling_threshold`` (linearly interpolated between samples), or NaN if
+    the system never decouples within the simulated window.
+    """
+    t = np.asarray(res['t'])
+    coupling = np.asarray(res['coupling'])
+
+    below = np.flatnonzero(coupling < coupling_threshold)
+    if below.size == 0:
+        t_dec = np.nan
+    elif below[0] == 0:
+        t_dec = float(t[0])
+    else:
+        i = below[0]
+        c0, c1 = coupling[i - 1], coupling[i]
+        t_dec = float(t[i - 1] + (c0 - coupling_threshold) / (c0 - c1) * (t[i] - t[i - 1]))
+
+    return {
+        'peak_P': float(np.max(res['P_t'])),
+        'final_coupling': float(coupling[-1]),
+        'final_I_sub': float(res['I_sub'][-1]),
+        'time_to_decoupling': t_dec,
+    }
+
+
+def _curvature_estimate(values, axes):
+    """Per-node error estimate for multilinear interpolation.
+
+    Along each axis, the linear interpolation error inside a cell is bounded by
+    h^2/8 * |f''|; with the second derivative estimated from the table itself,
+    this reduces to |second difference| / 8, scaled by ``ESTIMATE_SAFETY`` to
+    cover curvature that varies inside a cell. Where the second difference is
+    comparable to the first differences around it (a jump, e.g. at
+    ``decouple_threshold``, or an under-resolved feature), the stencil says
+    nothing about curvature and the full spread of the neighbouring cells is
+    used instead. Edge nodes reuse the stencil of their inner neighbour,
+    contributions from all axes are summed, a floor of ``SOLVER_TOLERANCE``
+    (relative to the node value) accounts for integration noise, and NaN
+    stencils map to +inf.
+
+    This is still an estimate, not a guaranteed bound.
+    """
+    estimate = SOLVER_TOLERANCE * (1.0 + np.abs(values))
+    for axis, grid in enumerate(axes):
+        if len(grid) < 3:
+            raise ValueError("every table axis needs at least 3 points to estimate errors")
+        n = values.shape[axis]
+        d1 = np.abs(np.diff(values, axis=axis))
+        spread = np.maximum(np.take(d1, range(0, n - 2), axis=axis), np.take(d1, range(1, n - 1), axis=axis))
+        d2 = np.abs(np.diff(values, n=2, axis=axis))
+        with np.errstate(invalid='ignore'):
+            axis_estimate = np.where(d2 > 0.5 * spread, spread, ESTIMATE_SAFETY * d2 / 8.0)
+        pad = [(1, 1) if a == axis else (0, 0) for a in range(values.ndim)]
+        estimate += np.pad(axis_estimate, pad, mode='edge')
+    return np.nan_to_num(estimate, nan=np.inf)
+
+
+class SurrogateTable:
+    """Dense lookup table of simulation summaries over a declared domain.
+
+    The table axes are ``T_load`` followed by zero or more SystemParameters
+    field names. All other parameters are fixed to ``base_params``; queries
+    whose parameters differ from the base outside the tabulated fields are
+    always answered by simulation.
+
+    Use ``build`` to precompute a table, ``save`` / ``load`` to persist it and
+    ``query`` to evaluate it.
+    """
+
+    def __init__(self, axes, values, base_params, t_max=50, steps=500, coupling_threshold=0.5):
+        self.axes = {name: np.asarray(grid, dtype=float) for name, grid in axes.items()}
+        self.values = {q: np.asarray(values[q], dtype=float) for q in QUANTITIES}
+        self.base_params = base_params
+        self.t_max = t_max
+        self.steps = steps
+        self.coupling_threshold = coupling_threshold
+
+        grids = tuple(self.axes.values())
+        self._interp = {
+            q: RegularGridInterpolator(grids, self.values[q], method='linear')
+            for q in QUANTITIES
+        }
+        self._estimates = {q: _curvature_estimate(self.values[q], grids) for q in QUANTITIES}
+
+    @classmethod
+    def build(cls, T_values, param_axes=None, params=None, t_max=50, steps=500, coupling_threshold=0.5):
+        """Precompute a table by simulating every grid node.
+
+        Parameters
+        ----------
+        T_values : array-like
+            Strictly increasing load grid (at least 3 points).
+        param_axes : dict, optional
+            Mapping SystemParameters field name -> strictly increasing grid.
+            One or two fields are typical; the table size is the product of
+            all grid lengths.
+        params : SystemParameters, optional
+            Base parameters for all fields that are not tabulated.
+        """
+        if params is None:
+            params = SystemParameters()
+        param_axes = dict(param_axes or {})
+        for name in param_axes:
+            if name not in _PARAM_FIELDS:
+                raise ValueError(f"unknown SystemParameters field: {name!r}")
+
+        axes = {'T_load': np.asarray(T_values, dtype=float)}
+        axes.update({name: np.asarray(grid, dtype=float) for name, grid in param_axes.items()})
+        for name, grid in axes.items():
+            if grid.ndim != 1 or grid.size < 3 or np.any(np.diff(grid) <= 0):
+                raise ValueError(f"axis {name!r} must be a strictly increasing 1-D grid with >= 3 points")
+
+        shape = tuple(grid.size for grid in axes.values())
+        values = {q: np.empty(shape) for q in QUANTITIES}
+
+        for idx in np.ndindex(*shape):
+            node = {name: float(grid[i]) for (name, grid), i in zip(axes.items(), idx)}
+            T_load = node.pop('T_load')
+            node_params = replace(params, **node)
+            res = run_single_simulation(T_load, node_params, t_max=t_max, steps=steps)
+            summary = summarize_simulation(res, coupling_threshold)
+            for q in QUANTITIES:
+                values[q][idx] = summary[q]
+
+        return cls(axes, values, params, t_max=t_max, steps=steps, coupling_threshold=coupling_threshold)
+
+    def save(self, path):
+        """Write the table to a compressed ``.npz`` file (no pickling)."""
+        payload = {
+            'axis_names': np.array(list(self.axes)),
+            'param_names': np.array(_PARAM_FIELDS),
+            'param_values': np.array([getattr(self.base_params, f) for f in _PARAM_FIELDS], dtype=float),
+            'settings': np.array([self.t_max, self.steps, self.coupling_threshold], dtype=float),
+        }
+        for name, grid in self.axes.items():
+            payload[f'axis__{name}'] = grid
+        for q in QUANTITIES:
+            payload[f'value__{q}'] = self.values[q]
+        np.savez_compressed(path, **payload)
+
+    @classmethod
+    def load(cls, path):
+        """Read a table written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            axes = {str(name): data[f'axis__{name}'] for name in data['axis_names']}
+            values = {q: data[f'value__{q}'] for q in QUANTITIES}
+            base = dict(zip((str(n) for n in data['param_names']), data['param_values'].tolist()))
+            t_max, steps, coupling_threshold = data['settings'].tolist()
+
+        params = SystemParameters(**{k: v for k, v in base.items() if k in _PARAM_FIELDS})
+        return cls(axes, values, params, t_max=t_max, steps=int(steps), coupling_threshold=coupling_threshold)
+
+    def _locate(self, T_load, params):
+        """Return the grid point for a query, or None if it is outside the domain."""
+        point = []
+        for name, grid in self.axes.items():
+            x = T_load if name == 'T_load' else getattr(params, name)
+            if not (grid[0] <= x <= grid[-1]):
+                return None
+            point.append(float(x))
+
+        fixed = asdict(self.base_params)
+        query = asdict(params)
+        for name in _PARAM_FIELDS:
+            if name not in self.axes and query[name] != fixed[name]:
+                return None
+        return point
+
+    def _cell_corners(self, point):
+        """Index tuples of the 2^d grid nodes enclosing ``point``."""
+        lo = []
+        for x, grid in zip(point, self.axes.values()):
+            i = int(np.clip(np.searchsorted(grid, x, side='right') - 1, 0, grid.size - 2))
+            lo.append(i)
+        return [tuple(i + o for i, o in zip(lo, offs)) for offs in np.ndindex(*(2,) * len(lo))]
+
+    def interpolate(self, T_load, params=None):
+        """Interpolate all quantities without fallback.
+
+        Returns
+        -------
+        tuple
+            ``(values, error_estimates)`` dictionaries, or ``None`` if the query
+            lies outside the tabulated domain.
+        """
+        if params is None:
+            params = self.base_params
+        point = self._locate(T_load, params)
+        if point is None:
+            return None
+
+        corners = self._cell_corners(point)
+        values, errors = {}, {}
+        for q in QUANTITIES:
+            corner_vals = np.array([self.values[q][c] for c in corners])
+            if np.all(np.isnan(corner_vals)):
+                # Uniformly "never decouples" (or similar): exact, not interpolated
+                values[q], errors[q] = np.nan, 0.0
+            elif np.any(np.isnan(corner_vals)):
+                values[q], errors[q] = np.nan, np.inf
+            else:
+                values[q] = float(self._interp[q](point)[0])
+                errors[q] = float(max(self._estimates[q][c] for c in corners))
+        return values, errors
+
+    def query(self, T_load, params=None, max_error=None):
+        """Return the tabulated scalars for ``T_load`` and ``params``.
+
+        Parameters
+        ----------
+        T_load : float
+            Load level.
+        params : SystemParameters, optional
+            Defaults to the table's base parameters.
+        max_error : float | dict, optional
+            Absolute tolerance on the error estimate, either for all quantities
+            or per quantity. Defaults to ``DEFAULT_MAX_ERROR``.
+
+        Returns
+        -------
+        dict
+            ``{'values': {...}, 'error_estimate': {...}, 'source': 'table' | 'simulation'}``.
+            Table answers carry the curvature-based error estimate (not a
+            guaranteed bound); simulated answers report zero.
+        """
+        if params is None:
+            params = self.base_params
+        if max_error is None:
+            max_error = DEFAULT_MAX_ERROR
+        if not isinstance(max_error, dict):
+            max_error = {q: float(max_error) for q in QUANTITIES}
+
+        hit = self.interpolate(T_load, params)
+        if hit is not None:
+            values, errors = hit
+            if all(errors[q] <= max_error.get(q, np.inf) for q in QUANTITIES):
+                return {'values': values, 'error_estimate': errors, 'source': 'table'}
+
+        res = run_single_simulation(T_load, params, t_max=self.t_max, steps=self.steps)
+        values = summarize_simulation(res, self.coupling_threshold)
+        return {
+            'values': values,
+            'error_estimate': {q: 0.0 for q in QUANTITIES},
+            'source': 'simulation',
+        }
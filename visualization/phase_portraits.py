@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from pathlib import Path
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+import numpy as np
+
+from sidsmp.core.dynamics import compute_nullclines, system_derivatives
+from sidsmp.simulation.engine import run_ensemble_simulation
+
+
+def evaluate_vector_field(T_load, params, I_raw, I_sub, coupling=1.0):
+    """
+    Evaluate the vector field on a dense (I_raw, I_sub, coupling) mesh.
+
+    Parameters
+    ----------
+    T_load : float
+        Informational load.
+    params : SystemParameters
+        Model parameters.
+    I_raw, I_sub, coupling : float | array-like
+        1-D axes of the mesh (scalars give a degenerate axis of length 1).
+
+    Returns
+    -------
+    tuple
+        ``(mesh, derivatives)``, both of shape (3, n_raw, n_sub, n_coupling),
+        with ``mesh[i]`` / ``derivatives[i]`` indexed as [I_raw, I_sub, coupling].
+    """
+    axes = [np.atleast_1d(np.asarray(a, dtype=float)) for a in (I_raw, I_sub, coupling)]
+    mesh = np.stack(np.meshgrid(*axes, indexing="ij"))
+    return mesh, system_derivatives(mesh, 0.0, T_load, params)
+
+
+def _settled_crossing_time(t, series, threshold):
+    """Time after which each row of `series` stays below `threshold`.
+
+    Rows that end above the threshold (never decouple, or re-couple) give NaN;
+    rows that start and stay below it give t[0].
+    """
+    above = series >= threshold
+    steps = series.shape[1]
+    # Index of the last sample at/above the threshold (-1 if none)
+    last = steps - 1 - np.argmax(above[:, ::-1], axis=1)
+    last = np.where(above.any(axis=1), last, -1)
+    settled = ~above[:, -1]
+
+    i = np.clip(last + 1, 0, steps - 1)
+    prev = np.clip(last, 0, steps - 1)
+    rows = np.arange(series.shape[0])
+    c0, c1 = series[rows, prev], series[rows, i]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(last >= 0, (c0 - threshold) / (c0 - c1), 0.0)
+        t_cross = np.where(last >= 0, t[prev] + frac * (t[i] - t[prev]), t[0])
+    return np.where(settled, t_cross, np.nan)
+
+
+def sweep_initial_conditions(T_load, params, I_raw0, coupling0, I_sub0=0.0,
+                             coupling_threshold=0.5, t_max=50, steps=500):
+    """
+    Integrate a full grid of initial conditions as one batch.
+
+    The grid spans (I_raw0, coupling0) at a fixed initial structure I_sub0,
+    i.e. the free initial conditions of the engine's default start
+    ``[1.0, 0.0, 1.0]``.
+
+    Returns
+    -------
+    dict
+        'I_raw0', 'coupling0' (1-D axes), 'trajectories' (ensemble output with
+        arrays of shape (n_traj, steps)), and outcome maps of shape
+        (len(I_raw0), len(coupling0)): 'final_coupling', 'final_I_sub',
+        'peak_I_sub', 'time_to_decoupling' (time after which coupling stays
+        below `coupling_threshold`, NaN if it ends above) and 'decoupled'
+        (final coupling below `coupling_threshold`).
+    """
+    I_raw0 = np.atleast_1d(np.asarray(I_raw0, dtype=float))
+    coupling0 = np.atleast_1d(np.asarray(coupling0, dtype=float))
+    R, C = np.meshgrid(I_raw0, coupling0, indexing="ij")
+    y0 = np.column_stack([R.ravel(), np.full(R.size, float(I_sub0)), C.ravel()])
+
+    traj = run_ensemble_simulation(T_load, params, y0, t_max=t_max, steps=steps)
+    shape = R.shape
+    final_coupling = traj['coupling'][:, -1]
+
+    return {
+        'I_raw0': I_raw0,
+        'coupling0': coupling0,
+        'trajectories': traj,
+        'final_coupling': final_coupling.reshape(shape),
+        'final_I_sub': traj['I_sub'][:, -1].reshape(shape),
+        'peak_I_sub': traj['I_sub'].max(axis=1).reshape(shape),
+        'time_to_decoupling': _settled_crossing_time(traj['t'], traj['coupling'], coupling_threshold).reshape(shape),
+        'decoupled': (final_coupling < coupling_threshold).reshape(shape),
+    }
+
+
+def _prepare_output(filename):
+    out_path = Path(filename)
+    if out_path.parent and str(out_path.parent) not in (".", ""):
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+    return out_path
+
+
+def plot_phase_portrait(T_load, params, filename: str | Path = Path("phase_portrait.png"),
+                        I_raw_max=2.0, I_sub_max=None, coupling=1.0,
+                        n_field=40, n_ic=(40, 25)) -> Path:
+    """
+    Phase portrait in the (I_raw, I_sub) plane for a single load level.
+
+    The streamlines show the vector field on the slice ``coupling = const``,
+    the dashed curve is the dI_sub/dt = 0 nullcline on that slice, and the thin
+    lines are the projections of a batch of trajectories started from a grid of
+    (I_raw0, coupling0) initial conditions with I_sub0 = 0. Since coupling
+    evolves along the trajectories, their projections need not follow the
+    streamlines of a fixed-coupling slice exactly.
+
+    Returns
+    -------
+    Path
+        Absolute path of the saved figure.
+    """
+    out_path = _prepare_output(filename)
+
+    sweep = sweep_initial_conditions(
+        T_load, params,
+        np.linspace(0.0, I_raw_max, n_ic[0]),
+        np.linspace(0.0, 1.0, n_ic[1]),
+    )
+    traj = sweep['trajectories']
+    if I_sub_max is None:
+        I_sub_max = max(1.1 * float(np.max(traj['I_sub'])), 1e-3)
+
+    I_raw = np.linspace(0.0, I_raw_max, n_field)
+    I_sub = np.linspace(0.0, I_sub_max, n_field)
+    _, deriv = evaluate_vector_field(T_load, params, I_raw, I_sub, coupling)
+    # streamplot expects arrays indexed as [y, x]
+    U = deriv[0, :, :, 0].T
+    V = deriv[1, :, :, 0].T
+    speed = np.hypot(U, V)
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+
+    segments = np.stack([traj['I_raw'], traj['I_sub']], axis=-1)
+    ax.add_collection(LineCollection(segments, colors="gray", linewidths=0.3, alpha=0.25))
+
+    ax.streamplot(I_raw, I_sub, U, V, color=speed, cmap="viridis", density=1.2, linewidth=0.8)
+
+    null = compute_nullclines(I_raw, T_load, params, coupling=coupling)
+    ax.plot(null['I_raw'], null['I_sub'], "r--", label=r"$dI_{sub}/dt = 0$" + f" (coupling={coupling:g})")
+
+    ax.set_xlim(0.0, I_raw_max)
+    ax.set_ylim(0.0, I_sub_max)
+    ax.set_title(f"Phase portrait at T={T_load} ({traj['I_raw'].shape[0]} trajectories)")
+    ax.set_xlabel("Raw Information (I_raw)")
+    ax.set_ylabel("Structured Information (I_sub)")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=200, bbox_inches="tight")
+    plt.close(fig)
+
+    abs_path = out_path.resolve()
+    print(f"Saved phase portrait figure to: {abs_path}")
+    return abs_path
+
+
+def _colorbar_if_finite(fig, im, ax, values, label):
+    """Attach a colorbar only if the panel shows at least one finite value."""
+    if np.isfinite(values).any():
+        fig.colorbar(im, ax=ax, label=label)
+
+
+def plot_decoupling_outcomes(params, filename: str | Path = Path("decoupling_outcomes.png"),
+                             T_range=(0.0, 5.0), n_T=80, n_coupling=60, I_raw0=1.0,
+                             coupling_threshold=0.5, t_max=50, steps=500) -> Path:
+    """
+    Decoupling outcomes over load T_load and initial coupling.
+
+    Coupling relaxes towards a target set by T_load alone, independently of
+    I_raw, so the outcome is mapped over the two quantities that actually
+    change it. Each load is one batch over the initial-coupling axis
+    (I_raw0 fixed, I_sub0 = 0).
+
+    Left: time after which coupling stays below `coupling_threshold`; cells
+    that end coupled show their final coupling instead (blue scale), and the
+    boundary of the decoupled region is drawn in white. Right: peak structured
+    information reached along each trajectory.
+
+    Returns
+    -------
+    Path
+        Absolute path of the saved figure.
+    """
+    out_path = _prepare_output(filename)
+
+    loads = np.linspace(T_range[0], T_range[1], n_T)
+    coupling0 = np.linspace(0.0, 1.0, n_coupling)
+
+    t_dec = np.empty((n_coupling, n_T))
+    final_coupling = np.empty((n_coupling, n_T))
+    peak_I_sub = np.empty((n_coupling, n_T))
+    for j, T in enumerate(loads):
+        sweep = sweep_initial_conditions(T, params, [I_raw0], coupling0,
+                                         coupling_threshold=coupling_threshold, t_max=t_max, steps=steps)
+        t_dec[:, j] = sweep['time_to_decoupling'][0]
+        final_coupling[:, j] = sweep['final_coupling'][0]
+        peak_I_sub[:, j] = sweep['peak_I_sub'][0]
+
+    decoupled = np.isfinite(t_dec)
+    extent = (loads[0], loads[-1], 0.0, 1.0)
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    coupled_part = np.ma.masked_where(decoupled, final_coupling)
+    im = ax1.imshow(coupled_part, origin="lower", extent=extent, aspect="auto", cmap="Blues", vmin=0.0, vmax=1.0)
+    _colorbar_if_finite(fig, im, ax1, coupled_part.filled(np.nan), "final coupling (not decoupled)")
+    decoupled_part = np.ma.masked_invalid(t_dec)
+    im = ax1.imshow(decoupled_part, origin="lower", extent=extent, aspect="auto", cmap="magma")
+    _colorbar_if_finite(fig, im, ax1, t_dec, "time to decoupling")
+    if decoupled.any() and not decoupled.all():
+        ax1.contour(loads, coupling0, decoupled.astype(float), levels=[0.5], colors="white")
+    threshold_in_range = loads[0] <= params.decouple_threshold <= loads[-1]
+    if threshold_in_range:
+        ax1.axvline(params.decouple_threshold, color="tab:cyan", linestyle=":", label="decouple_threshold")
+        ax1.legend(loc="lower left")
+    ax1.set_title(f"Decoupling outcome ({decoupled.mean():.0%} of {decoupled.size} runs decoupled)")
+    ax1.set_xlabel("Load T")
+    ax1.set_ylabel("Initial coupling")
+
+    im = ax2.imshow(peak_I_sub, origin="lower", extent=extent, aspect="auto", cmap="viridis")
+    _colorbar_if_finite(fig, im, ax2, peak_I_sub, "peak I_sub")
+    if threshold_in_range:
+        ax2.axvline(params.decouple_threshold, color="white", linestyle=":")
+    ax2.set_title(f"Peak structured information (I_raw0={I_raw0:g})")
+    ax2.set_xlabel("Load T")
+    ax2.set_ylabel("Initial coupling")
+
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=200, bbox_inches="tight")
+    plt.close(fig)
+
+    abs_path = out_path.resolve()
+    print(f"Saved decoupling outcome figure to: {abs_path}")
+    return abs_path